@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+🌐 TIC TAC TOE NETWORK PLAY 🌐
+==============================
+Connects two TicTacToe clients over TCP for networked Player vs Player.
+
+One client hosts (listens for the other), or both connect to a relay that
+pairs them up. Either way, once connected each client receives a HELLO
+telling it which player it is: the host (or the first client to reach
+the relay) plays X and is the authority if the boards ever disagree.
+
+PROTOCOL
+--------
+Every message is a fixed 6-byte frame (network byte order):
+
+    type : 1 byte   HELLO, MOVE, RESET or RESYNC
+    seq  : 2 bytes  move number (1 for the first move of a game)
+    cell : 1 byte   row * 3 + col of the move (HELLO: your player)
+    sum  : 2 bytes  base-3 rank of the board after the move
+
+Only moves are sent, never boards. The receiver applies a MOVE when its
+seq is the next one expected, then compares its own board's rank with
+the checksum; a MOVE it already has must match its own history. On a
+gap, a different or illegal move or a checksum mismatch the guest
+sends RESYNC and the host answers with RESET followed by its moves.
+
+Run a relay for two clients (e.g. for testing over loopback):
+    python3 network.py --port 5050
+"""
+
+import argparse
+import queue
+import socket
+import struct
+import threading
+from collections import namedtuple
+
+from position import Position
+from tablebase import flat_rank
+
+# ============================================================================
+# PROTOCOL CONSTANTS
+# ============================================================================
+
+DEFAULT_PORT = 5050
+
+# Message types
+HELLO = 1   # cell = player number assigned to the receiver
+MOVE = 2    # seq, cell, checksum
+RESET = 3   # start a new game (also starts a resync)
+RESYNC = 4  # ask the host to resend the game
+
+FRAME = struct.Struct('!BHBH')
+
+Message = namedtuple('Message', ['type', 'seq', 'cell', 'checksum'])
+
+
+def board_checksum(position):
+    """Checksum of a position: the base-3 rank of its cells"""
+    return flat_rank(position.cells)
+
+
+def open_socket(sock):
+    """Set socket options for low-latency play (no Nagle delay)"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def receive_frames(sock):
+    """Generate frames from a socket until it is closed"""
+    buffer = b''
+    while True:
+        try:
+            data = sock.recv(4096)
+        except OSError:
+            return
+        if not data:
+            return
+        buffer += data
+        while len(buffer) >= FRAME.size:
+            yield buffer[:FRAME.size]
+            buffer = buffer[FRAME.size:]
+
+
+# ============================================================================
+# NETWORK PEER
+# ============================================================================
+
+class NetworkPeer:
+    """
+    One end of a game connection.
+
+    Connecting and receiving happen on a background thread, so the game
+    loop never blocks: it sends with the send_* methods and collects
+    incoming messages with poll() once per frame.
+    """
+
+    def __init__(self):
+        self.sock = None
+        self.connected = False
+        self.closed = False
+        self.error = None
+        self.incoming = queue.Queue()
+        self.send_lock = threading.Lock()
+
+    @classmethod
+    def host(cls, port=DEFAULT_PORT, address=''):
+        """
+        Listen for one opponent on port (0 picks a free port)
+
+        The host plays X; the opponent is told it plays O.
+        """
+        peer = cls()
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((address, port))
+        listener.listen(1)
+        peer.port = listener.getsockname()[1]
+        peer.start(peer.accept, listener)
+        return peer
+
+    @classmethod
+    def connect(cls, address, port=DEFAULT_PORT):
+        """Connect to a host or relay; the player arrives in a HELLO"""
+        peer = cls()
+        peer.port = port
+        peer.start(peer.dial, address, port)
+        return peer
+
+    def start(self, target, *args):
+        """Run target (which sets up self.sock) and then receive"""
+        def run():
+            try:
+                target(*args)
+            except OSError as e:
+                self.error = str(e)
+                self.closed = True
+                return
+            self.connected = True
+            for frame in receive_frames(self.sock):
+                self.incoming.put(Message(*FRAME.unpack(frame)))
+            self.closed = True
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def accept(self, listener):
+        """Background thread: wait for the opponent and assign players"""
+        with listener:
+            sock, _ = listener.accept()
+        self.sock = open_socket(sock)
+        self.incoming.put(Message(HELLO, 0, 1, 0))
+        self.send(HELLO, cell=2)
+
+    def dial(self, address, port):
+        """Background thread: connect to the host or relay"""
+        self.sock = open_socket(socket.create_connection((address, port)))
+
+    def send(self, message_type, seq=0, cell=0, checksum=0):
+        """Send one frame (ignored until connected or after closing)"""
+        if self.sock is None or self.closed:
+            return
+        with self.send_lock:
+            try:
+                self.sock.sendall(FRAME.pack(message_type, seq, cell, checksum))
+            except OSError as e:
+                self.error = str(e)
+                self.closed = True
+
+    def send_move(self, position):
+        """Send the last move of position with its seq and checksum"""
+        self.send(MOVE, len(position.history), position.history[-1],
+                  board_checksum(position))
+
+    def send_game(self, position):
+        """Send the whole game as RESET followed by every move"""
+        self.send(RESET)
+        replay = Position()
+        for index in position.history:
+            replay.push(*divmod(index, 3))
+            self.send(MOVE, len(replay.history), index, board_checksum(replay))
+
+    def poll(self):
+        """All messages received since the last call"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.incoming.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def close(self):
+        """Close the connection"""
+        self.closed = True
+        if self.sock is not None:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+
+
+# ============================================================================
+# LOCAL RELAY
+# ============================================================================
+
+class Relay:
+    """
+    Stand-in for a relay server: pairs two clients and forwards their
+    frames unchanged.
+
+    The first client to connect plays X (and is the authority on resync),
+    the second plays O. Handles one pair of clients at a time.
+    """
+
+    def __init__(self, port=DEFAULT_PORT, address=''):
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((address, port))
+        self.listener.listen(2)
+        self.port = self.listener.getsockname()[1]
+
+    def start(self):
+        """Serve pairs of clients on a background thread"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def serve_forever(self):
+        """Pair clients and forward their frames until closed"""
+        while True:
+            try:
+                clients = [open_socket(self.listener.accept()[0]) for _ in range(2)]
+            except OSError:
+                return
+            for player, client in enumerate(clients, start=1):
+                client.sendall(FRAME.pack(HELLO, 0, player, 0))
+            forwarders = [
+                threading.Thread(target=self.forward, args=(source, target), daemon=True)
+                for source, target in (clients, clients[::-1])
+            ]
+            for forwarder in forwarders:
+                forwarder.start()
+            for forwarder in forwarders:
+                forwarder.join()
+            for client in clients:
+                client.close()
+
+    @staticmethod
+    def forward(source, target):
+        """Copy frames from source to target until either side closes"""
+        for frame in receive_frames(source):
+            try:
+                target.sendall(frame)
+            except OSError:
+                break
+        try:
+            target.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self):
+        """Stop accepting clients"""
+        self.listener.close()
+
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tic Tac Toe relay server")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"port to listen on (default {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    relay = Relay(args.port)
+    print(f"🌐 Relay listening on port {relay.port} (Ctrl+C to stop)")
+    try:
+        relay.serve_forever()
+    except KeyboardInterrupt:
+        relay.close()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🌳 TIC TAC TOE GAME-TREE ENUMERATOR (PERFT) 🌳
+==============================================
+Walks every legal game of Tic Tac Toe using the game's own rules
+(get_empty_cells, check_winner_for_player, is_board_full) and counts the
+finished games by length and result.
+
+There are exactly 255,168 different games. Because the counts are known,
+the walk is both a correctness check for the rules code (any bug changes
+the numbers) and a repeatable speed benchmark for it.
+
+Usage:
+    python3 perft.py            # Count, verify and report speed
+    python3 perft.py --runs 5   # Best of 5 runs
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+# Only the rules are used; keep pygame's import banner out of the report
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from position import Position
+from tictactoe import GRID_SIZE, TicTacToe
+
+# ============================================================================
+# REFERENCE VALUES
+# ============================================================================
+
+# Finished games by (number of moves, result); result uses the same
+# values as TicTacToe.winner: 1 = X wins, 2 = O wins, 'draw'
+REFERENCE_COUNTS = {
+    (5, 1): 1440,
+    (6, 2): 5328,
+    (7, 1): 47952,
+    (8, 2): 72576,
+    (9, 1): 81792,
+    (9, 'draw'): 46080,
+}
+REFERENCE_TOTAL = 255168
+
+
+# ============================================================================
+# TREE WALK
+# ============================================================================
+
+def rules_game():
+    """
+    A TicTacToe instance with an empty board and nothing else
+
+    The rules methods only read self.position, so no window, assets or
+    sounds are created.
+    """
+    game = TicTacToe.__new__(TicTacToe)
+    game.position = Position()
+    return game
+
+
+def walk_games(game, depth=0):
+    """
+    Generate every finished game reachable from the current board
+
+    Parameters:
+    -----------
+    game : TicTacToe
+        Game whose position is walked (moves are pushed during the walk
+        and popped again before the generator is exhausted)
+    depth : int
+        Number of moves already made
+
+    Yields:
+    -------
+    tuple : (number of moves, result) for each finished game
+    """
+    player = game.position.player
+    for row, col in game.get_empty_cells():
+        # Try this move
+        game.position.push(row, col)
+
+        if game.check_winner_for_player(player):
+            yield depth + 1, player
+        elif game.is_board_full():
+            yield depth + 1, 'draw'
+        else:
+            yield from walk_games(game, depth + 1)
+
+        # Undo move
+        game.position.pop()
+
+
+def perft(game=None):
+    """
+    Count all finished games from the starting position
+
+    Returns:
+    --------
+    Counter : {(number of moves, result): number of games}
+    """
+    if game is None:
+        game = rules_game()
+    return Counter(walk_games(game))
+
+
+def verify(counts):
+    """
+    Compare counts from perft() with the reference values
+
+    Returns:
+    --------
+    list : (key, expected, actual) for every mismatch; empty if correct
+    """
+    keys = sorted(set(REFERENCE_COUNTS) | set(counts), key=str)
+    return [(key, REFERENCE_COUNTS.get(key, 0), counts.get(key, 0))
+            for key in keys
+            if REFERENCE_COUNTS.get(key, 0) != counts.get(key, 0)]
+
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+def main():
+    """Run the enumeration, print the breakdown and verify it"""
+    parser = argparse.ArgumentParser(description="Count every Tic Tac Toe game")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="number of timed runs (the fastest is reported)")
+    args = parser.parse_args()
+
+    best_time = float('inf')
+    for _ in range(max(args.runs, 1)):
+        start = time.perf_counter()
+        counts = perft()
+        best_time = min(best_time, time.perf_counter() - start)
+
+    print(f"{'moves':>5}  {'X wins':>8}  {'O wins':>8}  {'draws':>8}")
+    for depth in range(1, GRID_SIZE * GRID_SIZE + 1):
+        row = [counts.get((depth, result), 0) for result in (1, 2, 'draw')]
+        if any(row):
+            print(f"{depth:>5}  {row[0]:>8}  {row[1]:>8}  {row[2]:>8}")
+
+    total = sum(counts.values())
+    print(f"\nTotal games: {total}")
+    print(f"Time: {best_time:.3f} s ({total / best_time:,.0f} games/sec)")
+
+    mismatches = verify(counts)
+    if total != REFERENCE_TOTAL or mismatches:
+        print("\n❌ Counts do not match the reference values:")
+        for key, expected, actual in mismatches:
+            print(f"   {key}: expected {expected}, got {actual}")
+        sys.exit(1)
+    print("\n✅ All counts match the reference values")
+
+
+if __name__ == "__main__":
+    main()
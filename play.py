@@ -4,18 +4,26 @@
 This launcher checks dependencies and starts the game
 """
 
+import argparse
+import importlib.metadata
+import importlib.util
 import sys
 import subprocess
+import time
+
+from network import DEFAULT_PORT
 
 def check_pygame():
-    """Check if pygame is installed"""
-    try:
-        import pygame
-        print("✅ Pygame is installed (version {})".format(pygame.version.ver))
-        return True
-    except ImportError:
+    """Check if pygame is installed (without importing it)"""
+    if importlib.util.find_spec("pygame") is None:
         print("❌ Pygame is not installed!")
         return False
+    try:
+        version = importlib.metadata.version("pygame")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    print("✅ Pygame is installed (version {})".format(version))
+    return True
 
 def install_pygame():
     """Install pygame using pip"""
@@ -32,6 +40,19 @@ def install_pygame():
 
 def main():
     """Main launcher function"""
+    parser = argparse.ArgumentParser(description="Tic Tac Toe game launcher")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print startup timings (import, window, first frame, audio)")
+    parser.add_argument("--policy", metavar="FILE", nargs="?", const="assets/policy.npz",
+                        help="AI uses a policy trained with selfplay.py instead of "
+                             "Minimax (requires numpy)")
+    network_group = parser.add_mutually_exclusive_group()
+    network_group.add_argument("--host", type=int, nargs="?", const=DEFAULT_PORT, metavar="PORT",
+                               help="host a networked PvP game (default port %(const)s)")
+    network_group.add_argument("--connect", metavar="HOST[:PORT]",
+                               help="join a networked PvP game or relay")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("  🎮 TIC TAC TOE - GAME LAUNCHER ❌⭕")
     print("=" * 60)
@@ -56,8 +77,25 @@ def main():
     print()
     
     try:
+        start = time.perf_counter()
         from tictactoe import TicTacToe
-        game = TicTacToe()
+        if args.profile_startup:
+            print(f"⏱️  {'import':<12} {(time.perf_counter() - start) * 1000:8.1f} ms")
+        game = TicTacToe(fast_startup=True, profile_startup=args.profile_startup)
+        if args.policy:
+            from selfplay import LearnedPolicy
+            game.policy = LearnedPolicy.load(args.policy)
+            print(f"🤖 AI uses the learned policy from {args.policy}")
+        if args.host is not None or args.connect:
+            from network import NetworkPeer
+            if args.host is not None:
+                peer = NetworkPeer.host(args.host)
+                print(f"🌐 Hosting on port {peer.port}, waiting for opponent...")
+            else:
+                address, _, port = args.connect.partition(":")
+                peer = NetworkPeer.connect(address, int(port or DEFAULT_PORT))
+                print(f"🌐 Connecting to {address}:{peer.port}...")
+            game.start_network(peer)
         game.run()
     except Exception as e:
         print(f"\n❌ Error starting game: {e}")
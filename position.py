@@ -0,0 +1,116 @@
+"""
+♟️ TIC TAC TOE POSITION ♟️
+==========================
+The board state of a game: the 9 cells, the player to move and the stack
+of moves that led here.
+
+Moves are made with push() and taken back with pop(), so a search can
+explore a private copy() of the position and always leave it exactly as
+it found it. snapshot() returns an immutable, hashable copy of the state
+that can be shared freely between threads or used as a dictionary key.
+
+Cells are stored flat (index = row * 3 + col): 0 = empty, 1 = X, 2 = O.
+"""
+
+from collections import namedtuple
+
+# All eight winning lines as flat cell indices (row * 3 + col)
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),             # Diagonals
+)
+
+# Immutable copy of a position (cells is a tuple of 9 ints)
+Snapshot = namedtuple('Snapshot', ['cells', 'player'])
+
+
+class Position:
+    """
+    Mutable board with an explicit move stack.
+
+    A Position is owned by one game or one search at a time; give other
+    readers a snapshot() and other searches a copy().
+    """
+
+    def __init__(self, cells=None, player=1, history=None):
+        """
+        Parameters:
+        -----------
+        cells : sequence of 9 ints, optional
+            Flat board (default: empty)
+        player : int
+            Player to move (1 = X, 2 = O)
+        history : list of int, optional
+            Flat indices of the moves played so far, oldest first
+        """
+        self.cells = list(cells) if cells is not None else [0] * 9
+        self.player = player
+        self.history = list(history) if history is not None else []
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Create a position (without move history) from a Snapshot"""
+        return cls(snapshot.cells, snapshot.player)
+
+    @property
+    def board(self):
+        """The cells as a new 3x3 nested list (changes are not saved)"""
+        cells = self.cells
+        return [cells[0:3], cells[3:6], cells[6:9]]
+
+    def get(self, row, col):
+        """Contents of a cell (0 = empty, 1 = X, 2 = O)"""
+        return self.cells[row * 3 + col]
+
+    def push(self, row, col):
+        """
+        Place the mark of the player to move and pass the turn
+
+        Raises ValueError if the cell is already taken.
+        """
+        index = row * 3 + col
+        if self.cells[index] != 0:
+            raise ValueError(f"cell ({row}, {col}) is not empty")
+        self.cells[index] = self.player
+        self.history.append(index)
+        self.player = 3 - self.player
+
+    def pop(self):
+        """
+        Take back the last move
+
+        Returns:
+        --------
+        tuple : (row, col) of the move that was taken back
+
+        Raises IndexError if no moves have been made.
+        """
+        index = self.history.pop()
+        self.cells[index] = 0
+        self.player = 3 - self.player
+        return divmod(index, 3)
+
+    def copy(self):
+        """Independent copy, cheap enough to make for every search"""
+        return Position(self.cells, self.player, self.history)
+
+    def snapshot(self):
+        """Immutable, hashable copy of the cells and player to move"""
+        return Snapshot(tuple(self.cells), self.player)
+
+    def is_won(self, player):
+        """Check if player has three in a row"""
+        cells = self.cells
+        for a, b, c in WIN_LINES:
+            if cells[a] == cells[b] == cells[c] == player:
+                return True
+        return False
+
+    def is_full(self):
+        """Check if no empty cells are left"""
+        return 0 not in self.cells
+
+    def empty_cells(self):
+        """(row, col) of every empty cell, in row-major order"""
+        return [divmod(index, 3) for index, cell in enumerate(self.cells) if cell == 0]
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+🖼️ TIC TAC TOE BATCH RENDERER 🖼️
+================================
+Renders board images to PNG files without opening a window, e.g. for
+share cards or as frames for replay videos.
+
+Each worker process creates one headless TicTacToe (offscreen surface,
+SDL dummy video driver) and reuses its scaled images and fonts for every
+board it draws; boards are spread across all CPU cores.
+
+Usage:
+    python3 render.py --replay 4,0,8,2,6 --out frames/
+    python3 render.py --boards boards.txt --out cards/ --size 300x350
+    python3 render.py --all --out positions/
+
+A board in a --boards file is one line of 9 digits, row by row:
+0 = empty, 1 = X, 2 = O (e.g. 120010002). Replay moves are cell numbers
+0-8 (row * 3 + col).
+"""
+
+import argparse
+import multiprocessing
+import os
+import struct
+import sys
+import time
+import zlib
+
+# Never open a window; keep pygame's import banner out of the report
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+# Let worker processes stop on SIGTERM instead of SDL catching it
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from position import Position
+from tictactoe import GameMode, HEIGHT, TicTacToe, WIDTH
+
+# Default zlib level for PNG output: the background image doesn't compress
+# well, so higher levels cost several times the encoding time for a few
+# percent smaller files
+PNG_COMPRESSION = 1
+
+# Headless game and PNG level of the current worker process (see init_worker)
+worker_game = None
+worker_compression = PNG_COMPRESSION
+
+
+# ============================================================================
+# BOARD STATES
+# ============================================================================
+
+def parse_board(line):
+    """
+    Parse a board written as 9 digits (0 = empty, 1 = X, 2 = O)
+
+    Raises ValueError if the line is not a board that can occur in a game.
+    """
+    cells = tuple(int(digit) for digit in line.strip())
+    if len(cells) != 9 or any(cell not in (0, 1, 2) for cell in cells):
+        raise ValueError(f"not a board: {line.strip()!r}")
+    if cells.count(1) - cells.count(2) not in (0, 1):
+        raise ValueError(f"impossible move counts: {line.strip()!r}")
+    return cells
+
+
+def replay_states(moves):
+    """
+    Boards of a game replay: the empty board, then one per move
+
+    Raises ValueError on an illegal move.
+    """
+    position = Position()
+    states = [tuple(position.cells)]
+    for index in moves:
+        if not 0 <= index < 9:
+            raise ValueError(f"no such cell: {index}")
+        position.push(*divmod(index, 3))
+        states.append(tuple(position.cells))
+        if position.is_won(1) or position.is_won(2) or position.is_full():
+            break
+    return states
+
+
+def all_positions():
+    """Every board that can occur in a game, in a stable order"""
+    seen = set()
+    boards = []
+
+    def visit(position):
+        cells = tuple(position.cells)
+        if cells in seen:
+            return
+        seen.add(cells)
+        boards.append(cells)
+        if position.is_won(1) or position.is_won(2):
+            return
+        for row, col in position.empty_cells():
+            position.push(row, col)
+            visit(position)
+            position.pop()
+
+    visit(Position())
+    return boards
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def render_board(game, cells, result_screen=False):
+    """
+    Draw a board on the game's screen surface
+
+    Parameters:
+    -----------
+    game : TicTacToe
+        Headless game to draw with
+    cells : sequence of 9 ints
+        Board to draw
+    result_screen : bool
+        Draw the game-over screen on top if the game has ended
+
+    Returns:
+    --------
+    pygame.Surface : the game's screen (reused by the next call)
+    """
+    player = 1 if cells.count(1) == cells.count(2) else 2
+    game.position = Position(cells, player)
+
+    if game.position.is_won(1):
+        game.winner = 1
+    elif game.position.is_won(2):
+        game.winner = 2
+    elif game.position.is_full():
+        game.winner = 'draw'
+    else:
+        game.winner = None
+    game.game_over = game.winner is not None
+
+    game.draw_board()
+    if result_screen and game.game_over:
+        game.draw_game_over()
+    return game.screen
+
+
+def save_png(surface, path, compression=PNG_COMPRESSION):
+    """
+    Save a surface as an RGB PNG file with the given zlib level (0-9)
+
+    pygame.image.save always uses the default level, which dominates the
+    time per image in a batch.
+    """
+    width, height = surface.get_size()
+    pixels = pygame.image.tostring(surface, 'RGB')
+    stride = width * 3
+    # Each scanline starts with filter type 0 (none)
+    scanlines = b''.join(b'\x00' + pixels[y * stride:(y + 1) * stride]
+                         for y in range(height))
+
+    def chunk(chunk_type, data):
+        return (struct.pack('!I', len(data)) + chunk_type + data
+                + struct.pack('!I', zlib.crc32(chunk_type + data)))
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('!IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(scanlines, compression)))
+        f.write(chunk(b'IEND', b''))
+
+
+def init_worker(size, compression=PNG_COMPRESSION):
+    """Create the worker's headless game (assets are loaded once here)"""
+    global worker_game, worker_compression
+    worker_game = TicTacToe(headless=True, size=size)
+    worker_game.mode = GameMode.PVP
+    worker_compression = compression
+
+
+def render_job(job):
+    """Render one (cells, path, result_screen) job in a worker"""
+    cells, path, result_screen = job
+    save_png(render_board(worker_game, cells, result_screen), path, worker_compression)
+    return path
+
+
+def render_batch(jobs, size=(WIDTH, HEIGHT), workers=None, compression=PNG_COMPRESSION):
+    """
+    Render (cells, path, result_screen) jobs to PNG files
+
+    Parameters:
+    -----------
+    jobs : list
+        Boards to render and where to save them
+    size : tuple
+        Image size in pixels
+    workers : int, optional
+        Number of processes (default: one per CPU; 1 renders in-process)
+    compression : int
+        zlib level of the PNG files (0-9)
+
+    Returns:
+    --------
+    int : number of images written
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        init_worker(size, compression)
+        for job in jobs:
+            render_job(job)
+        return len(jobs)
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    pool = multiprocessing.Pool(workers, initializer=init_worker,
+                                initargs=(size, compression))
+    try:
+        count = sum(1 for _ in pool.imap_unordered(render_job, jobs, chunksize))
+        # Let the workers exit on their own rather than terminating them
+        pool.close()
+        pool.join()
+    except BaseException:
+        pool.terminate()
+        raise
+    return count
+
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+def parse_size(text):
+    """Parse an image size written as WIDTHxHEIGHT"""
+    width, _, height = text.lower().partition('x')
+    return int(width), int(height)
+
+
+def main():
+    """Collect the boards to render, render them and report the speed"""
+    parser = argparse.ArgumentParser(description="Render Tic Tac Toe boards to PNG")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--replay", metavar="MOVES",
+                        help="comma-separated cells of a game, one frame per move")
+    source.add_argument("--boards", metavar="FILE",
+                        help="file with one 9-digit board per line")
+    source.add_argument("--all", action="store_true",
+                        help="every board that can occur in a game")
+    parser.add_argument("--out", default="renders", help="output directory")
+    parser.add_argument("--size", type=parse_size, default=(WIDTH, HEIGHT),
+                        help=f"image size (default {WIDTH}x{HEIGHT})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of processes (default: one per CPU)")
+    parser.add_argument("--compression", type=int, choices=range(10), default=PNG_COMPRESSION,
+                        metavar="0-9", help=f"PNG compression level (default {PNG_COMPRESSION})")
+    parser.add_argument("--result-screen", action="store_true",
+                        help="draw the game-over screen on finished games")
+    args = parser.parse_args()
+
+    try:
+        if args.replay:
+            boards = replay_states([int(cell) for cell in args.replay.split(',')])
+        elif args.boards:
+            with open(args.boards) as f:
+                boards = [parse_board(line) for line in f if line.strip()]
+        else:
+            boards = all_positions()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = [(cells, os.path.join(args.out, f"frame_{number:05d}.png"), args.result_screen)
+            for number, cells in enumerate(boards)]
+
+    start = time.perf_counter()
+    count = render_batch(jobs, args.size, args.workers, args.compression)
+    elapsed = time.perf_counter() - start
+    print(f"✅ Rendered {count} images to {args.out}/ "
+          f"in {elapsed:.2f} s ({count / elapsed:,.0f} images/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+🤖 TIC TAC TOE SELF-PLAY TRAINER 🤖
+==================================
+Learns to play by playing against itself, as a cheap alternative to the
+Minimax search. Requires NumPy (pip3 install numpy).
+
+The learned policy is a table of values, one per board (indexed by the
+same base-3 rank as the tablebase). The value of a board is how good it
+is for the player who just moved there: +1 = win, 0 = draw, -1 = loss.
+To move, a player looks at the boards each legal move leads to and picks
+the one with the highest value.
+
+Training uses temporal-difference learning (TD(0) on these "afterstates"):
+after each move, the value of the previous board is nudged towards the
+negated value of the board the opponent just chose, or towards the final
+result when the game ends. Thousands of games are played in lockstep as
+NumPy arrays, one move of every game per step.
+
+Usage:
+    python3 selfplay.py --games 2000000
+    python3 selfplay.py --games 2000000 --resume     # continue training
+    python3 selfplay.py --games 0 --benchmark         # compare with Minimax
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from tablebase import TABLEBASE_SIZE, board_rank
+
+# ============================================================================
+# TRAINER CONSTANTS
+# ============================================================================
+
+POLICY_PATH = 'assets/policy.npz'
+
+# 3^i for every cell: rank of a board = cells @ POWERS
+POWERS = 3 ** np.arange(9, dtype=np.int64)
+
+# All eight winning lines as flat cell indices (row * 3 + col)
+LINES = np.array([
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),             # Diagonals
+])
+
+
+# ============================================================================
+# BATCHED GAMES
+# ============================================================================
+
+def choose_moves(values, boards, ranks, player, epsilon, rng):
+    """
+    Pick one move per game: greedy on the afterstate values, random with
+    probability epsilon
+
+    Parameters:
+    -----------
+    values : ndarray (TABLEBASE_SIZE,)
+        Afterstate values
+    boards : ndarray (games, 9)
+        Boards of the games to move in
+    ranks : ndarray (games,)
+        Base-3 ranks of those boards
+    player : int
+        Player to move in all of them (1 = X, 2 = O)
+    epsilon : float or ndarray (games,)
+        Probability of a random move (1 for a random player)
+
+    Returns:
+    --------
+    ndarray (games,) : cell index of each move
+    """
+    empty = boards == 0
+    afterstates = np.where(empty, ranks[:, None] + player * POWERS, 0)
+    noise = rng.random(boards.shape)
+    # Tiny noise breaks ties between equally valued moves at random
+    greedy = np.where(empty, values[afterstates] + noise * 1e-6, -np.inf).argmax(axis=1)
+    random = np.where(empty, noise, -1.0).argmax(axis=1)
+    explore = rng.random(len(boards)) < epsilon
+    return np.where(explore, random, greedy)
+
+
+def play_games(values, games, rng, epsilon=0.0, alpha=None, random_player=None):
+    """
+    Play a batch of games in lockstep, optionally learning from them
+
+    Parameters:
+    -----------
+    values : ndarray (TABLEBASE_SIZE,)
+        Afterstate values (updated in place when alpha is given)
+    games : int
+        Number of games to play
+    rng : numpy.random.Generator
+    epsilon : float
+        Probability of a random (exploring) move
+    alpha : float, optional
+        Learning rate; None plays without learning
+    random_player : int, optional
+        Player (1 or 2) who always moves at random, for evaluation
+
+    Returns:
+    --------
+    ndarray (games,) : winner of each game (0 = draw, 1 = X, 2 = O)
+    """
+    boards = np.zeros((games, 9), dtype=np.int8)
+    ranks = np.zeros(games, dtype=np.int64)
+    previous = np.full(games, -1, dtype=np.int64)  # Opponent's last afterstate
+    winners = np.zeros(games, dtype=np.int8)
+    active = np.arange(games)
+
+    for turn in range(9):
+        player = 1 if turn % 2 == 0 else 2
+        board, rank = boards[active], ranks[active]
+
+        move_epsilon = 1.0 if player == random_player else epsilon
+        moves = choose_moves(values, board, rank, player, move_epsilon, rng)
+        board[np.arange(len(active)), moves] = player
+        after = rank + player * POWERS[moves]
+
+        won = (board[:, LINES] == player).all(axis=2).any(axis=1)
+        done = won | (turn == 8)
+
+        if alpha is not None:
+            reward = won.astype(np.float64)
+            # Previous afterstate of the opponent: our result is their loss
+            has_previous = previous[active] >= 0
+            targets = [np.where(done, -reward, -values[after])[has_previous],
+                       reward[done]]
+            states = [previous[active][has_previous], after[done]]
+            update_values(values, np.concatenate(states), np.concatenate(targets), alpha)
+
+        boards[active], ranks[active], previous[active] = board, after, after
+        winners[active[won]] = player
+        active = active[~done]
+        if not len(active):
+            break
+
+    return winners
+
+
+def update_values(values, states, targets, alpha):
+    """
+    Move values[states] towards targets by alpha
+
+    Errors for the same state within a batch are averaged, so a state
+    seen in thousands of games moves by alpha, not thousands of times.
+    """
+    errors = targets - values[states]
+    total = np.bincount(states, weights=errors, minlength=len(values))
+    count = np.bincount(states, minlength=len(values))
+    seen = count > 0
+    values[seen] += alpha * total[seen] / count[seen]
+
+
+def evaluate(values, games, rng):
+    """
+    Results against a random opponent, playing X and then O
+
+    Returns:
+    --------
+    dict : {'X': (wins, draws, losses), 'O': (...)} as fractions
+    """
+    results = {}
+    for mark, player in (('X', 1), ('O', 2)):
+        winners = play_games(values, games, rng, random_player=3 - player)
+        results[mark] = (np.mean(winners == player), np.mean(winners == 0),
+                         np.mean(winners == 3 - player))
+    return results
+
+
+# ============================================================================
+# LEARNED POLICY (AI BACKEND)
+# ============================================================================
+
+def best_moves(values):
+    """
+    Best move for every board rank (-1 where the board is full or invalid)
+
+    Computed once for the whole table, so each move afterwards is a
+    single array lookup.
+    """
+    ranks = np.arange(TABLEBASE_SIZE, dtype=np.int64)
+    cells = (ranks[:, None] // POWERS) % 3
+    player = np.where((cells == 1).sum(axis=1) == (cells == 2).sum(axis=1), 1, 2)
+    empty = cells == 0
+    afterstates = np.where(empty, ranks[:, None] + player[:, None] * POWERS, 0)
+    moves = np.where(empty, values[afterstates], -np.inf).argmax(axis=1)
+    return np.where(empty.any(axis=1), moves, -1)
+
+
+class LearnedPolicy:
+    """
+    AI backend using trained values. best_move() takes a board and returns
+    (row, col) like TicTacToe.get_best_move(), so the game can use it in
+    place of the search (TicTacToe.policy).
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.moves = best_moves(values)
+
+    @classmethod
+    def load(cls, path=POLICY_PATH):
+        """Load a policy from a checkpoint written by the trainer"""
+        with np.load(path) as checkpoint:
+            return cls(checkpoint['values'])
+
+    def best_move(self, board):
+        """Best move (row, col) for the player to move, or None"""
+        move = self.moves[board_rank(board)]
+        if move < 0:
+            return None
+        return divmod(int(move), 3)
+
+
+# ============================================================================
+# CHECKPOINTS
+# ============================================================================
+
+def save_checkpoint(path, values, games):
+    """Write values and the number of games trained (atomically)"""
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        np.savez(f, values=values, games=games)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path):
+    """Return (values, games trained) from a checkpoint"""
+    with np.load(path) as checkpoint:
+        return checkpoint['values'].copy(), int(checkpoint['games'])
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def benchmark(policy):
+    """
+    Compare the learned policy with Minimax on every position where the
+    AI (O) is to move: time per move and how often it finds a best move
+    """
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    from perft import rules_game
+    from position import Position
+    from render import all_positions
+
+    game = rules_game()
+    positions = [Position(cells, 2) for cells in all_positions()
+                 if cells.count(1) == cells.count(2) + 1
+                 and not Position(cells).is_won(1) and 0 in cells]
+
+    start = time.perf_counter()
+    learned = [policy.best_move(position.board) for position in positions]
+    learned_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = [game.evaluate_moves(2, position) for position in positions]
+    minimax_time = time.perf_counter() - start
+
+    optimal = sum(1 for move, score in zip(learned, scores)
+                  if score[move] == max(score.values()))
+    count = len(positions)
+    print(f"\nBenchmark on {count} positions (AI to move):")
+    print(f"  Learned: {learned_time / count * 1e6:10.1f} µs/move")
+    print(f"  Minimax: {minimax_time / count * 1e6:10.1f} µs/move")
+    print(f"  Learned move is optimal in {optimal / count:.1%} of positions")
+
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+def main():
+    """Train by self-play with checkpoints and throughput reports"""
+    parser = argparse.ArgumentParser(description="Train a Tic Tac Toe policy by self-play")
+    parser.add_argument("--games", type=int, default=2000000, help="games to play")
+    parser.add_argument("--batch", type=int, default=4096, help="games played in lockstep")
+    parser.add_argument("--alpha", type=float, default=0.1, help="learning rate")
+    parser.add_argument("--epsilon", type=float, default=0.4,
+                        help="exploration rate (decays to a quarter of this)")
+    parser.add_argument("--checkpoint", default=POLICY_PATH, help="checkpoint file")
+    parser.add_argument("--every", type=int, default=50,
+                        help="batches between reports and checkpoints")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="compare the trained policy with Minimax")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.resume or args.games == 0:
+        try:
+            values, trained = load_checkpoint(args.checkpoint)
+        except (OSError, KeyError) as e:
+            print(f"❌ Could not load {args.checkpoint}: {e}")
+            sys.exit(1)
+        print(f"📂 Loaded {args.checkpoint} ({trained} games trained)")
+    else:
+        values, trained = np.zeros(TABLEBASE_SIZE), 0
+
+    batches = -(-args.games // args.batch)
+    start = report_start = time.perf_counter()
+    report_games = 0
+    for number in range(1, batches + 1):
+        epsilon = args.epsilon * (1 - 0.75 * number / batches)
+        games = min(args.batch, args.games - (number - 1) * args.batch)
+        play_games(values, games, rng, epsilon, args.alpha)
+        trained += games
+        report_games += games
+
+        if number % args.every == 0 or number == batches:
+            elapsed = time.perf_counter() - report_start
+            results = evaluate(values, 2000, rng)
+            print(f"{trained:>10} games  {report_games / elapsed:>9,.0f} games/sec  "
+                  + "  ".join(f"{mark}: {win:.0%}W {draw:.0%}D {loss:.0%}L vs random"
+                              for mark, (win, draw, loss) in results.items()))
+            save_checkpoint(args.checkpoint, values, trained)
+            report_start, report_games = time.perf_counter(), 0
+
+    if batches:
+        elapsed = time.perf_counter() - start
+        print(f"\n✅ Trained {args.games} games in {elapsed:.1f} s "
+              f"({args.games / elapsed:,.0f} games/sec), saved {args.checkpoint}")
+
+    if args.benchmark:
+        benchmark(LearnedPolicy(values))
+
+
+if __name__ == "__main__":
+    main()
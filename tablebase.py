@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+🗄️ TIC TAC TOE ENDGAME TABLEBASE 🗄️
+====================================
+A precomputed table with the perfect-play result and best move for every
+Tic Tac Toe position, stored as one byte per board.
+
+Every board is identified by its base-3 rank: the 9 cells (row by row,
+0 = empty, 1 = X, 2 = O) read as the digits of a base-3 number, so the
+table has exactly 3^9 = 19683 entries:
+
+    rank = board[0][0] * 3^0 + board[0][1] * 3^1 + ... + board[2][2] * 3^8
+
+Each byte holds the result for the player to move in its high nibble and
+the best move (row * 3 + col) in its low nibble:
+
+    value : 0 = unreachable position, 1 = loss, 2 = draw, 3 = win
+    move  : 0-8, or 15 when the game is already over
+
+The table is generated once (python3 tablebase.py) and opened read-only
+with mmap, so any number of processes share a single copy through the
+operating system's page cache, with no per-process build cost.
+"""
+
+import mmap
+import os
+import sys
+
+from position import WIN_LINES
+
+# ============================================================================
+# TABLEBASE CONSTANTS
+# ============================================================================
+
+TABLEBASE_PATH = 'assets/tablebase.bin'
+TABLEBASE_SIZE = 3 ** 9
+
+# Result for the player to move (high nibble)
+UNREACHABLE = 0
+LOSS = 1
+DRAW = 2
+WIN = 3
+
+# Best move placeholder for finished games (low nibble)
+NO_MOVE = 15
+
+# Same scoring as TicTacToe.minimax: a win d moves after the evaluated
+# move scores 10 - d, so faster wins (and slower losses) are preferred
+WIN_SCORE = 10
+
+
+# ============================================================================
+# BOARD RANKING
+# ============================================================================
+
+def board_rank(board):
+    """
+    Base-3 rank of a 3x3 board (0 to 3^9 - 1)
+
+    Parameters:
+    -----------
+    board : list of lists
+        3x3 board, 0 = empty, 1 = X, 2 = O
+    """
+    return flat_rank([cell for row in board for cell in row])
+
+
+def flat_rank(cells):
+    """Base-3 rank of a flat 9-cell board"""
+    rank = 0
+    for cell in reversed(cells):
+        rank = rank * 3 + cell
+    return rank
+
+
+def has_won(cells, player):
+    """Check if player has three in a row on a flat 9-cell board"""
+    for a, b, c in WIN_LINES:
+        if cells[a] == cells[b] == cells[c] == player:
+            return True
+    return False
+
+
+# ============================================================================
+# GENERATION
+# ============================================================================
+
+def solve(cells, player, scores):
+    """
+    Score a position for the player to move, filling in every position
+    reachable from it
+
+    Parameters:
+    -----------
+    cells : list
+        Flat 9-cell board (modified during the search, restored on return)
+    player : int
+        Player to move (1 = X, 2 = O)
+    scores : dict
+        {rank: (score, best move)} for every position solved so far,
+        including finished games (best move NO_MOVE)
+
+    Returns:
+    --------
+    int : Best score for the player to move, as returned by
+        TicTacToe.evaluate_moves() for the best move
+    """
+    rank = flat_rank(cells)
+    if rank in scores:
+        return scores[rank][0]
+
+    best_score = -float('inf')
+    best_move = NO_MOVE
+    opponent = 3 - player
+
+    # Try all empty cells in row-major order, keeping the first best
+    # move so the choice matches TicTacToe.get_best_move()
+    for index in range(9):
+        if cells[index] != 0:
+            continue
+
+        cells[index] = player
+        if has_won(cells, player):
+            score = WIN_SCORE
+            # Game over: the opponent has lost
+            scores[flat_rank(cells)] = (-WIN_SCORE, NO_MOVE)
+        elif 0 not in cells:
+            score = 0
+            scores[flat_rank(cells)] = (0, NO_MOVE)
+        else:
+            # The opponent's score one move later, seen from our side
+            reply = solve(cells, opponent, scores)
+            score = -reply + (1 if reply > 0 else -1 if reply < 0 else 0)
+        cells[index] = 0
+
+        if score > best_score:
+            best_score = score
+            best_move = index
+
+    scores[rank] = (best_score, best_move)
+    return best_score
+
+
+def build_table():
+    """
+    Compute the tablebase contents
+
+    Returns:
+    --------
+    bytearray : TABLEBASE_SIZE bytes, one per board rank
+    """
+    scores = {}
+    solve([0] * 9, 1, scores)
+
+    table = bytearray(TABLEBASE_SIZE)
+    for rank, (score, move) in scores.items():
+        value = WIN if score > 0 else LOSS if score < 0 else DRAW
+        table[rank] = (value << 4) | move
+
+    return table
+
+
+def generate(path=TABLEBASE_PATH):
+    """
+    Build the tablebase and write it to path
+
+    The file is written under a temporary name and then renamed, so
+    processes that already have the old table open are never affected.
+    """
+    table = build_table()
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(table)
+    os.replace(temp_path, path)
+    return table
+
+
+# ============================================================================
+# READ-ONLY LOOKUP
+# ============================================================================
+
+class Tablebase:
+    """
+    Read-only, memory-mapped view of a generated tablebase file.
+
+    Opening is O(1): nothing is parsed or copied, and all processes that
+    open the same file share its pages.
+    """
+
+    def __init__(self, path=TABLEBASE_PATH):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) != TABLEBASE_SIZE:
+            self.data.close()
+            raise ValueError(f"{path} is not a tablebase "
+                             f"({TABLEBASE_SIZE} bytes expected)")
+
+    def close(self):
+        """Unmap the tablebase file"""
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def lookup(self, board):
+        """
+        Look up a position
+
+        Returns:
+        --------
+        tuple : (value, move)
+            value is UNREACHABLE, LOSS, DRAW or WIN for the player to move
+            move is (row, col), or None if the game is over or the
+            position cannot occur in a real game
+        """
+        entry = self.data[board_rank(board)]
+        value, move = entry >> 4, entry & 0x0F
+        if value == UNREACHABLE or move == NO_MOVE:
+            return value, None
+        return value, divmod(move, 3)
+
+    def best_move(self, board):
+        """Best move (row, col) for the player to move, or None"""
+        return self.lookup(board)[1]
+
+
+def open_tablebase(path=TABLEBASE_PATH):
+    """Open the tablebase at path, or return None if it doesn't exist"""
+    try:
+        return Tablebase(path)
+    except (OSError, ValueError):
+        return None
+
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else TABLEBASE_PATH
+    print(f"Generating tablebase ({TABLEBASE_SIZE} positions)...")
+    table = generate(output)
+    reachable = sum(1 for entry in table if entry)
+    print(f"\n✅ Wrote {output} ({reachable} reachable positions)")
@@ -8,18 +8,28 @@ Author: Professional Python Game Developer
 Created: 2026
 """
 
+import os
 import pygame
 import sys
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum
 
+import network
+from position import Position
+from tablebase import open_tablebase
+
 # ============================================================================
 # GAME CONSTANTS
 # ============================================================================
 
-# Screen dimensions
+# Screen dimensions (initial window size; the layout below is designed for
+# this size and scaled uniformly when the window is resized)
 WIDTH = 600
 HEIGHT = 700  # Extra space for title and mode selection
+MIN_WIDTH = 300
+MIN_HEIGHT = 350
 
 # Colors (RGB format)
 WHITE = (255, 255, 255)
@@ -39,6 +49,16 @@ GRID_OFFSET_Y = 150
 # Line settings
 LINE_WIDTH = 10
 
+# Mark (X / O) image size inside a cell
+MARK_SIZE = 100
+
+# Memory budget of the scaled image cache in bytes (one full-screen 4K
+# background alone takes about 32 MB)
+SCALED_CACHE_BYTES = 64 * 1024 * 1024
+
+# Minimax score of a win found at depth 0 (see TicTacToe.minimax)
+WIN_SCORE = 10
+
 
 # ============================================================================
 # GAME MODE ENUMERATION
@@ -49,6 +69,58 @@ class GameMode(Enum):
     MENU = 0
     PVP = 1  # Player vs Player
     PVE = 2  # Player vs AI
+    NETWORK = 3  # Player vs Player over the network
+
+
+# ============================================================================
+# SCALED SURFACE CACHE
+# ============================================================================
+
+class ScaledSurfaceCache:
+    """
+    Least-recently-used cache of scaled image copies.
+    
+    Scaling a large image is expensive, so each (image name, target size)
+    is scaled once and reused. When the window is resized back and forth
+    the old sizes are still cached; least recently used entries are
+    evicted once the cached surfaces take more than `capacity` bytes
+    (the newest entry is always kept).
+    """
+    
+    def __init__(self, capacity=SCALED_CACHE_BYTES):
+        self.capacity = capacity
+        self.sources = {}
+        self.entries = OrderedDict()
+        self.size = 0
+    
+    def add_source(self, name, surface):
+        """Register an original (unscaled) image under a name"""
+        self.sources[name] = surface
+        for key in [key for key in self.entries if key[0] == name]:
+            self.size -= self.surface_bytes(self.entries.pop(key))
+    
+    def get(self, name, size):
+        """Return the image scaled to size, or None if it was not loaded"""
+        source = self.sources.get(name)
+        if source is None:
+            return None
+        key = (name, size)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+        surface = pygame.transform.scale(source, size)
+        self.entries[key] = surface
+        self.size += self.surface_bytes(surface)
+        while self.size > self.capacity and len(self.entries) > 1:
+            self.size -= self.surface_bytes(self.entries.popitem(last=False)[1])
+        return surface
+    
+    @staticmethod
+    def surface_bytes(surface):
+        """Pixel memory used by a surface"""
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
 
 
 # ============================================================================
@@ -61,77 +133,235 @@ class TicTacToe:
     and AI implementation using the Minimax algorithm.
     """
     
-    def __init__(self):
-        """Initialize the game"""
+    def __init__(self, fast_startup=False, profile_startup=False, headless=False,
+                 size=(WIDTH, HEIGHT)):
+        """
+        Initialize the game
+        
+        Parameters:
+        -----------
+        fast_startup : bool
+            Initialize only the display and font subsystems before the
+            first frame; the mixer and sounds are loaded on a background
+            thread and become available when ready
+        profile_startup : bool
+            Print startup timings (window, assets, first frame, audio)
+        headless : bool
+            Draw to an offscreen surface of the given size instead of a
+            window (SDL dummy video driver, no audio), for batch rendering
+        size : tuple
+            Initial window or offscreen surface size
+        """
+        self.profile_startup = profile_startup
+        self.headless = headless
+        self.startup_times = {}
+        self._startup_t0 = time.perf_counter()
+        
         # Initialize Pygame
-        pygame.init()
-        pygame.mixer.init()
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            pygame.display.init()
+            pygame.font.init()
+        elif fast_startup:
+            pygame.display.init()
+            pygame.font.init()
+        else:
+            pygame.init()
+            pygame.mixer.init()
         
-        # Create game window
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Tic Tac Toe ❌⭕")
+        # Create game window (resizable; the layout follows the window size)
+        if headless:
+            self.screen = pygame.Surface(size)
+        else:
+            self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+            pygame.display.set_caption("Tic Tac Toe ❌⭕")
+        self.image_cache = ScaledSurfaceCache()
+        self.mark_startup("window")
         
         # Clock for controlling frame rate
         self.clock = pygame.time.Clock()
         
         # Load assets (images and sounds)
-        self.load_assets()
+        if headless:
+            self.load_images()
+            self.clear_sounds()
+        elif fast_startup:
+            self.load_images()
+            self.clear_sounds()
+            threading.Thread(target=self.load_audio_async, daemon=True).start()
+        else:
+            self.load_assets()
+        self.update_layout(*size)
+        self.mark_startup("assets")
+        
+        # Precomputed perfect-play moves (None until tablebase.py is run)
+        self.tablebase = open_tablebase()
+        
+        # Optional AI backend with a best_move(board) method, used instead
+        # of the search (e.g. selfplay.LearnedPolicy)
+        self.policy = None
+        
+        # Networked PvP connection and our player (known after HELLO)
+        self.peer = None
+        self.local_player = None
+        
+        # Move analysis (hint overlay), computed on a background thread
+        self.show_hints = False
+        self.analysis = (None, {})  # (position key, move scores)
+        self.analysis_generation = 0
         
         # Initialize game state
         self.reset_game()
         
         # Game mode
         self.mode = GameMode.MENU
+    
+    def mark_startup(self, label):
+        """Record (and optionally print) the time since startup began"""
+        if label in self.startup_times:
+            return
+        elapsed = (time.perf_counter() - self._startup_t0) * 1000
+        self.startup_times[label] = elapsed
+        if self.profile_startup:
+            print(f"⏱️  {label:<12} {elapsed:8.1f} ms")
         
     def load_assets(self):
         """Load all game assets (images and sounds)"""
+        self.load_images()
+        self.load_sounds()
+    
+    def load_images(self):
+        """
+        Load all game images
+        
+        The originals go into the scaled-surface cache; update_layout()
+        picks the copies that match the current window size.
+        """
         try:
-            # Load and scale images
-            self.x_img = pygame.image.load('assets/x.png')
-            self.x_img = pygame.transform.scale(self.x_img, (100, 100))
-            
-            self.o_img = pygame.image.load('assets/o.png')
-            self.o_img = pygame.transform.scale(self.o_img, (100, 100))
-            
-            self.grid_img = pygame.image.load('assets/grid.png')
-            self.grid_img = pygame.transform.scale(self.grid_img, (CELL_SIZE * 3, CELL_SIZE * 3))
-            
-            self.bg_img = pygame.image.load('assets/background.png')
-            self.bg_img = pygame.transform.scale(self.bg_img, (WIDTH, HEIGHT))
-            
-            # Load sounds
-            self.move_sound = pygame.mixer.Sound('assets/sounds/move.wav')
-            self.win_sound = pygame.mixer.Sound('assets/sounds/win.wav')
-            self.draw_sound = pygame.mixer.Sound('assets/sounds/draw.wav')
+            images = {
+                'x': pygame.image.load('assets/x.png'),
+                'o': pygame.image.load('assets/o.png'),
+                'grid': pygame.image.load('assets/grid.png'),
+                'bg': pygame.image.load('assets/background.png'),
+            }
+        except pygame.error as e:
+            print(f"Warning: Could not load some images: {e}")
+            print("Game will continue with fallback rendering.")
+            # No sources registered: the cache returns None for every
+            # image and the draw methods use fallback rendering
+            return
+        
+        for name, image in images.items():
+            self.image_cache.add_source(name, image)
+    
+    # ========================================================================
+    # LAYOUT
+    # ========================================================================
+    
+    def update_layout(self, width, height):
+        """
+        Recompute the layout for a window of the given size
+        
+        The original 600x700 layout is scaled uniformly to fit the window
+        and centered; the background fills the whole window. Scaled images
+        come from the LRU cache, so this only does real work for sizes not
+        seen recently, and normal frames just blit the stored surfaces.
+        Fonts are created on first use at the new scale and then reused by
+        every frame until the next resize.
+        """
+        if not self.headless:
+            # Windows can't shrink below the minimum size (thumbnails can)
+            width, height = max(width, MIN_WIDTH), max(height, MIN_HEIGHT)
+        self.width = width
+        self.height = height
+        self.scale = min(self.width / WIDTH, self.height / HEIGHT)
+        self.origin_x = (self.width - WIDTH * self.scale) / 2
+        self.origin_y = (self.height - HEIGHT * self.scale) / 2
+        
+        self.cell_size = self.scaled(CELL_SIZE)
+        self.grid_offset_x, self.grid_offset_y = self.pos(GRID_OFFSET_X, GRID_OFFSET_Y)
+        
+        mark_size = self.scaled(MARK_SIZE)
+        grid_size = self.cell_size * GRID_SIZE
+        self.x_img = self.image_cache.get('x', (mark_size, mark_size))
+        self.o_img = self.image_cache.get('o', (mark_size, mark_size))
+        self.grid_img = self.image_cache.get('grid', (grid_size, grid_size))
+        self.bg_img = self.image_cache.get('bg', (self.width, self.height))
+        
+        self.overlay = pygame.Surface((self.width, self.height))
+        self.overlay.set_alpha(200)
+        self.overlay.fill(WHITE)
+        self.fonts = {}
+    
+    def scaled(self, length):
+        """Scale a length from the base layout to the current window"""
+        return max(1, round(length * self.scale))
+    
+    def font(self, size):
+        """Default font at a base-layout size, scaled to the current layout"""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, self.scaled(size))
+        return font
+    
+    def pos(self, x, y):
+        """Map a point from the base layout to window coordinates"""
+        return (round(self.origin_x + x * self.scale),
+                round(self.origin_y + y * self.scale))
+    
+    def load_sounds(self):
+        """Load all sound effects and voices (mixer must be initialized)"""
+        try:
+            move_sound = pygame.mixer.Sound('assets/sounds/move.wav')
+            win_sound = pygame.mixer.Sound('assets/sounds/win.wav')
+            draw_sound = pygame.mixer.Sound('assets/sounds/draw.wav')
             
             # Load voice sounds
-            self.you_win_voice = pygame.mixer.Sound('assets/sounds/you_win.wav')
-            self.ai_wins_voice = pygame.mixer.Sound('assets/sounds/ai_wins.wav')
-            self.draw_voice = pygame.mixer.Sound('assets/sounds/draw_voice.wav')
+            you_win_voice = pygame.mixer.Sound('assets/sounds/you_win.wav')
+            ai_wins_voice = pygame.mixer.Sound('assets/sounds/ai_wins.wav')
+            draw_voice = pygame.mixer.Sound('assets/sounds/draw_voice.wav')
             
         except pygame.error as e:
-            print(f"Warning: Could not load some assets: {e}")
-            print("Game will continue with fallback rendering.")
-            # Set all assets to None to use fallback rendering
-            self.x_img = None
-            self.o_img = None
-            self.grid_img = None
-            self.bg_img = None
-            self.move_sound = None
-            self.win_sound = None
-            self.draw_sound = None
-            self.you_win_voice = None
-            self.ai_wins_voice = None
-            self.draw_voice = None
+            print(f"Warning: Could not load some sounds: {e}")
+            print("Game will continue without audio.")
+            self.clear_sounds()
+            return
+        
+        # Publish only once everything loaded, so a background loader
+        # never exposes a half-initialized set of sounds
+        self.move_sound = move_sound
+        self.win_sound = win_sound
+        self.draw_sound = draw_sound
+        self.you_win_voice = you_win_voice
+        self.ai_wins_voice = ai_wins_voice
+        self.draw_voice = draw_voice
+    
+    def clear_sounds(self):
+        """Set all sounds to None (the game plays silently)"""
+        self.move_sound = None
+        self.win_sound = None
+        self.draw_sound = None
+        self.you_win_voice = None
+        self.ai_wins_voice = None
+        self.draw_voice = None
+    
+    def load_audio_async(self):
+        """Background thread: initialize the mixer, then load the sounds"""
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Warning: Could not initialize audio: {e}")
+            return
+        self.load_sounds()
+        self.mark_startup("audio_ready")
     
     def reset_game(self):
         """Reset the game to initial state"""
-        # Game board (3x3 grid)
-        # 0 = empty, 1 = X (player 1), 2 = O (player 2 or AI)
-        self.board = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        # Game position: board, player to move (X first) and move stack
+        self.position = Position()
         
-        # Current player (1 = X, 2 = O)
-        self.current_player = 1
+        # Moves taken back with undo, most recent last
+        self.redo_stack = []
         
         # Game state
         self.game_over = False
@@ -139,6 +369,23 @@ class TicTacToe:
         
         # AI thinking flag
         self.ai_thinking = False
+        
+        # New position: refresh the hint overlay
+        if self.show_hints:
+            self.request_analysis()
+    
+    @property
+    def board(self):
+        """
+        The board as a 3x3 nested list (a copy; use make_move to play)
+        0 = empty, 1 = X (player 1), 2 = O (player 2 or AI)
+        """
+        return self.position.board
+    
+    @property
+    def current_player(self):
+        """Player to move (1 = X, 2 = O)"""
+        return self.position.player
     
     def draw_board(self):
         """Draw the game board"""
@@ -149,40 +396,41 @@ class TicTacToe:
             self.screen.fill(WHITE)
         
         # Draw title
-        font_large = pygame.font.Font(None, 60)
+        font_large = self.font(60)
         title = font_large.render("Tic Tac Toe ❌⭕", True, BLACK)
-        title_rect = title.get_rect(center=(WIDTH // 2, 50))
+        title_rect = title.get_rect(center=self.pos(WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Draw grid
         if self.grid_img:
-            self.screen.blit(self.grid_img, (GRID_OFFSET_X, GRID_OFFSET_Y))
+            self.screen.blit(self.grid_img, (self.grid_offset_x, self.grid_offset_y))
         else:
             # Fallback: Draw grid lines
+            x0, y0, cell = self.grid_offset_x, self.grid_offset_y, self.cell_size
             for i in range(1, GRID_SIZE):
                 # Vertical lines
                 pygame.draw.line(
                     self.screen, BLACK,
-                    (GRID_OFFSET_X + i * CELL_SIZE, GRID_OFFSET_Y),
-                    (GRID_OFFSET_X + i * CELL_SIZE, GRID_OFFSET_Y + CELL_SIZE * 3),
-                    LINE_WIDTH
+                    (x0 + i * cell, y0),
+                    (x0 + i * cell, y0 + cell * 3),
+                    self.scaled(LINE_WIDTH)
                 )
                 # Horizontal lines
                 pygame.draw.line(
                     self.screen, BLACK,
-                    (GRID_OFFSET_X, GRID_OFFSET_Y + i * CELL_SIZE),
-                    (GRID_OFFSET_X + CELL_SIZE * 3, GRID_OFFSET_Y + i * CELL_SIZE),
-                    LINE_WIDTH
+                    (x0, y0 + i * cell),
+                    (x0 + cell * 3, y0 + i * cell),
+                    self.scaled(LINE_WIDTH)
                 )
         
         # Draw X's and O's
+        board = self.board
         for row in range(GRID_SIZE):
             for col in range(GRID_SIZE):
-                cell = self.board[row][col]
+                cell = board[row][col]
                 if cell != 0:
                     # Calculate position
-                    x = GRID_OFFSET_X + col * CELL_SIZE + CELL_SIZE // 2
-                    y = GRID_OFFSET_Y + row * CELL_SIZE + CELL_SIZE // 2
+                    x, y = self.cell_center(row, col)
                     
                     if cell == 1:  # X
                         if self.x_img:
@@ -190,26 +438,41 @@ class TicTacToe:
                             self.screen.blit(self.x_img, img_rect)
                         else:
                             # Fallback: Draw X
-                            offset = 40
+                            offset = self.scaled(40)
                             pygame.draw.line(self.screen, RED,
                                            (x - offset, y - offset),
-                                           (x + offset, y + offset), 8)
+                                           (x + offset, y + offset), self.scaled(8))
                             pygame.draw.line(self.screen, RED,
                                            (x + offset, y - offset),
-                                           (x - offset, y + offset), 8)
+                                           (x - offset, y + offset), self.scaled(8))
                     else:  # O
                         if self.o_img:
                             img_rect = self.o_img.get_rect(center=(x, y))
                             self.screen.blit(self.o_img, img_rect)
                         else:
                             # Fallback: Draw O
-                            pygame.draw.circle(self.screen, BLUE, (x, y), 40, 8)
+                            pygame.draw.circle(self.screen, BLUE, (x, y),
+                                               self.scaled(40), self.scaled(8))
+        
+        # Draw move analysis over the empty cells
+        if self.show_hints and not self.game_over:
+            self.draw_hints()
         
         # Draw current player indicator
         if not self.game_over:
-            font_medium = pygame.font.Font(None, 36)
+            font_medium = self.font(36)
+            mark = 'X' if self.current_player == 1 else 'O'
             if self.mode == GameMode.PVP:
-                player_text = f"Player {'X' if self.current_player == 1 else 'O'}'s Turn"
+                player_text = f"Player {mark}'s Turn"
+            elif self.mode == GameMode.NETWORK:
+                if self.peer.closed:
+                    player_text = "Disconnected"
+                elif self.local_player is None:
+                    player_text = "Waiting for opponent..."
+                elif self.current_player == self.local_player:
+                    player_text = f"Your Turn ({mark})"
+                else:
+                    player_text = f"Opponent's Turn ({mark})"
             else:  # PVE mode
                 if self.current_player == 1:
                     player_text = "Your Turn (X)"
@@ -217,7 +480,33 @@ class TicTacToe:
                     player_text = "AI's Turn (O)"
             
             text = font_medium.render(player_text, True, BLACK)
-            text_rect = text.get_rect(center=(WIDTH // 2, 620))
+            text_rect = text.get_rect(center=self.pos(WIDTH // 2, 620))
+            self.screen.blit(text, text_rect)
+    
+    def draw_hints(self):
+        """
+        Draw the minimax outcome of every empty cell for the player to move
+        
+        Shows "W" (win), "D" (draw) or "L" (loss) and the number of moves
+        until the result, assuming perfect play afterwards. Nothing is drawn
+        until the background analysis for the current position is ready.
+        """
+        key, scores = self.analysis
+        if key != self.position_key():
+            return
+        
+        font_hint = self.font(32)
+        for (row, col), score in scores.items():
+            outcome, moves = self.describe_score(score, len(scores))
+            if outcome == 'win':
+                label, color = f"W{moves}", GREEN
+            elif outcome == 'loss':
+                label, color = f"L{moves}", RED
+            else:
+                label, color = f"D{moves}", GRAY
+            
+            text = font_hint.render(label, True, color)
+            text_rect = text.get_rect(center=self.cell_center(row, col))
             self.screen.blit(text, text_rect)
     
     def draw_menu(self):
@@ -229,40 +518,42 @@ class TicTacToe:
             self.screen.fill(WHITE)
         
         # Draw title
-        font_large = pygame.font.Font(None, 70)
+        font_large = self.font(70)
         title = font_large.render("Tic Tac Toe ❌⭕", True, BLACK)
-        title_rect = title.get_rect(center=(WIDTH // 2, 100))
+        title_rect = title.get_rect(center=self.pos(WIDTH // 2, 100))
         self.screen.blit(title, title_rect)
         
         # Draw subtitle
-        font_medium = pygame.font.Font(None, 40)
+        font_medium = self.font(40)
         subtitle = font_medium.render("Select Game Mode", True, BLACK)
-        subtitle_rect = subtitle.get_rect(center=(WIDTH // 2, 200))
+        subtitle_rect = subtitle.get_rect(center=self.pos(WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Draw buttons
-        font_button = pygame.font.Font(None, 50)
+        font_button = self.font(50)
         
         # Player vs Player button
-        pvp_rect = pygame.Rect(WIDTH // 2 - 150, 300, 300, 80)
-        pygame.draw.rect(self.screen, LIGHT_GRAY, pvp_rect, border_radius=10)
-        pygame.draw.rect(self.screen, BLACK, pvp_rect, 3, border_radius=10)
+        pvp_rect = pygame.Rect(self.pos(WIDTH // 2 - 150, 300),
+                               (self.scaled(300), self.scaled(80)))
+        pygame.draw.rect(self.screen, LIGHT_GRAY, pvp_rect, border_radius=self.scaled(10))
+        pygame.draw.rect(self.screen, BLACK, pvp_rect, self.scaled(3), border_radius=self.scaled(10))
         pvp_text = font_button.render("Player vs Player", True, BLACK)
         pvp_text_rect = pvp_text.get_rect(center=pvp_rect.center)
         self.screen.blit(pvp_text, pvp_text_rect)
         
         # Player vs AI button
-        pve_rect = pygame.Rect(WIDTH // 2 - 150, 420, 300, 80)
-        pygame.draw.rect(self.screen, LIGHT_GRAY, pve_rect, border_radius=10)
-        pygame.draw.rect(self.screen, BLACK, pve_rect, 3, border_radius=10)
+        pve_rect = pygame.Rect(self.pos(WIDTH // 2 - 150, 420),
+                               (self.scaled(300), self.scaled(80)))
+        pygame.draw.rect(self.screen, LIGHT_GRAY, pve_rect, border_radius=self.scaled(10))
+        pygame.draw.rect(self.screen, BLACK, pve_rect, self.scaled(3), border_radius=self.scaled(10))
         pve_text = font_button.render("Player vs AI", True, BLACK)
         pve_text_rect = pve_text.get_rect(center=pve_rect.center)
         self.screen.blit(pve_text, pve_text_rect)
         
         # Instructions
-        font_small = pygame.font.Font(None, 30)
+        font_small = self.font(30)
         inst_text = font_small.render("Click a button to start!", True, GRAY)
-        inst_rect = inst_text.get_rect(center=(WIDTH // 2, 580))
+        inst_rect = inst_text.get_rect(center=self.pos(WIDTH // 2, 580))
         self.screen.blit(inst_text, inst_rect)
         
         return pvp_rect, pve_rect
@@ -270,14 +561,11 @@ class TicTacToe:
     def draw_game_over(self):
         """Draw the game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(WHITE)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
         # Draw result
-        font_large = pygame.font.Font(None, 70)
-        font_medium = pygame.font.Font(None, 40)
+        font_large = self.font(70)
+        font_medium = self.font(40)
         
         if self.winner == 'draw':
             result_text = "It's a Draw!"
@@ -285,6 +573,13 @@ class TicTacToe:
         elif self.mode == GameMode.PVP:
             result_text = f"Player {'X' if self.winner == 1 else 'O'} Wins!"
             color = RED if self.winner == 1 else BLUE
+        elif self.mode == GameMode.NETWORK:
+            if self.winner == self.local_player:
+                result_text = "You Win! 🎉"
+                color = GREEN
+            else:
+                result_text = "You Lose!"
+                color = RED
         else:  # PVE mode
             if self.winner == 1:
                 result_text = "You Win! 🎉"
@@ -294,29 +589,36 @@ class TicTacToe:
                 color = RED
         
         result = font_large.render(result_text, True, color)
-        result_rect = result.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
+        result_rect = result.get_rect(center=self.pos(WIDTH // 2, HEIGHT // 2 - 50))
         self.screen.blit(result, result_rect)
         
         # Draw restart instruction
         restart = font_medium.render("Press R to Restart", True, BLACK)
-        restart_rect = restart.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50))
+        restart_rect = restart.get_rect(center=self.pos(WIDTH // 2, HEIGHT // 2 + 50))
         self.screen.blit(restart, restart_rect)
         
         # Draw menu instruction
         menu = font_medium.render("Press M for Menu", True, BLACK)
-        menu_rect = menu.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 100))
+        menu_rect = menu.get_rect(center=self.pos(WIDTH // 2, HEIGHT // 2 + 100))
         self.screen.blit(menu, menu_rect)
     
+    def cell_center(self, row, col):
+        """Window coordinates of the center of a board cell"""
+        x = self.grid_offset_x + col * self.cell_size + self.cell_size // 2
+        y = self.grid_offset_y + row * self.cell_size + self.cell_size // 2
+        return x, y
+    
     def get_cell_from_mouse(self, pos):
         """Convert mouse position to board cell coordinates"""
         x, y = pos
+        grid_size = self.cell_size * GRID_SIZE
         
         # Check if click is within the grid
-        if (GRID_OFFSET_X <= x <= GRID_OFFSET_X + CELL_SIZE * 3 and
-            GRID_OFFSET_Y <= y <= GRID_OFFSET_Y + CELL_SIZE * 3):
+        if (self.grid_offset_x <= x < self.grid_offset_x + grid_size and
+            self.grid_offset_y <= y < self.grid_offset_y + grid_size):
             
-            col = (x - GRID_OFFSET_X) // CELL_SIZE
-            row = (y - GRID_OFFSET_Y) // CELL_SIZE
+            col = (x - self.grid_offset_x) // self.cell_size
+            row = (y - self.grid_offset_y) // self.cell_size
             
             return row, col
         
@@ -328,18 +630,22 @@ class TicTacToe:
         Returns True if move was valid, False otherwise
         """
         # Check if cell is empty
-        if self.board[row][col] == 0:
-            # Place the mark
-            self.board[row][col] = self.current_player
+        if self.position.get(row, col) == 0:
+            # Place the mark (this passes the turn to the other player)
+            player = self.current_player
+            self.position.push(row, col)
+            
+            # A new move invalidates the moves that were undone
+            self.redo_stack = []
             
             # Play move sound
             if self.move_sound:
                 self.move_sound.play()
             
             # Check for winner or draw
-            if self.check_winner():
+            if self.check_winner_for_player(player):
                 self.game_over = True
-                self.winner = self.current_player
+                self.winner = player
                 # Play win sound and voice
                 if self.win_sound:
                     self.win_sound.play()
@@ -350,6 +656,10 @@ class TicTacToe:
                     elif self.winner == 2 and self.ai_wins_voice:
                         pygame.time.wait(500)
                         self.ai_wins_voice.play()
+                elif self.mode == GameMode.NETWORK:
+                    if self.winner == self.local_player and self.you_win_voice:
+                        pygame.time.wait(500)
+                        self.you_win_voice.play()
             elif self.is_board_full():
                 self.game_over = True
                 self.winner = 'draw'
@@ -359,45 +669,67 @@ class TicTacToe:
                 if self.draw_voice:
                     pygame.time.wait(500)
                     self.draw_voice.play()
-            else:
-                # Switch player
-                self.current_player = 3 - self.current_player  # Toggles between 1 and 2
+            elif self.show_hints:
+                # New position: refresh the hint overlay
+                self.request_analysis()
             
             return True
         
         return False
     
-    def check_winner(self):
+    def undo_move(self):
         """
-        Check if there's a winner
-        Returns True if current player has won, False otherwise
+        Take back the last move (in PVE mode, back to the player's turn)
+        
+        Returns True if a move was taken back, False otherwise
         """
-        # Check rows
-        for row in range(GRID_SIZE):
-            if (self.board[row][0] == self.board[row][1] == self.board[row][2] == self.current_player):
-                return True
+        if not self.position.history:
+            return False
         
-        # Check columns
-        for col in range(GRID_SIZE):
-            if (self.board[0][col] == self.board[1][col] == self.board[2][col] == self.current_player):
-                return True
+        self.redo_stack.append(self.position.pop())
+        if self.mode == GameMode.PVE:
+            # Also take back the AI's reply to the player's move
+            while self.current_player != 1 and self.position.history:
+                self.redo_stack.append(self.position.pop())
         
-        # Check diagonals
-        if (self.board[0][0] == self.board[1][1] == self.board[2][2] == self.current_player):
-            return True
+        self.game_over = False
+        self.winner = None
         
-        if (self.board[0][2] == self.board[1][1] == self.board[2][0] == self.current_player):
-            return True
+        # New position: refresh the hint overlay
+        if self.show_hints:
+            self.request_analysis()
+        return True
+    
+    def redo_move(self):
+        """
+        Play again the last move taken back with undo_move()
         
-        return False
+        Returns True if a move was replayed, False otherwise
+        """
+        if not self.redo_stack or self.game_over:
+            return False
+        
+        # make_move() starts a new redo stack; keep ours
+        redo_stack = self.redo_stack
+        self.make_move(*redo_stack.pop())
+        if self.mode == GameMode.PVE:
+            # Also replay the AI's reply
+            while self.current_player != 1 and redo_stack and not self.game_over:
+                self.make_move(*redo_stack.pop())
+        self.redo_stack = redo_stack
+        return True
+    
+    def check_winner(self):
+        """
+        Check if there's a winner
+        Returns True if the player who made the last move has won
+        (the turn has already passed to the other player), False otherwise
+        """
+        return self.position.is_won(3 - self.current_player)
     
     def is_board_full(self):
         """Check if the board is full (no empty cells)"""
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] == 0:
-                    return False
-        return True
+        return self.position.is_full()
     
     # ========================================================================
     # AI IMPLEMENTATION - MINIMAX ALGORITHM
@@ -405,14 +737,10 @@ class TicTacToe:
     
     def get_empty_cells(self):
         """Get list of all empty cells on the board"""
-        empty = []
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] == 0:
-                    empty.append((row, col))
-        return empty
+        return self.position.empty_cells()
     
-    def minimax(self, depth, is_maximizing, alpha=-float('inf'), beta=float('inf')):
+    def minimax(self, depth, is_maximizing, alpha=-float('inf'), beta=float('inf'),
+                position=None):
         """
         Minimax algorithm with Alpha-Beta pruning
         
@@ -439,6 +767,10 @@ class TicTacToe:
             Best value that the maximizer can guarantee
         beta : float
             Best value that the minimizer can guarantee
+        position : Position, optional
+            Position to search, with the player to move matching
+            is_maximizing (default: a private copy of the game position).
+            Moves are pushed and popped on it, never on the live game.
         
         Returns:
         --------
@@ -447,33 +779,35 @@ class TicTacToe:
             -10 if player wins
             0 if draw
         """
+        if position is None:
+            position = self.position.copy()
         
         # Check terminal states
         # If AI (player 2) wins
-        if self.check_winner_for_player(2):
+        if position.is_won(2):
             return 10 - depth  # Prefer faster wins
         
         # If human (player 1) wins
-        if self.check_winner_for_player(1):
+        if position.is_won(1):
             return depth - 10  # Prefer slower losses
         
         # If board is full (draw)
-        if self.is_board_full():
+        if position.is_full():
             return 0
         
         if is_maximizing:
             # AI's turn - maximize score
             max_eval = -float('inf')
             
-            for row, col in self.get_empty_cells():
-                # Try this move
-                self.board[row][col] = 2  # AI is player 2 (O)
+            for row, col in position.empty_cells():
+                # Try this move (AI is player 2, O)
+                position.push(row, col)
                 
                 # Recursively evaluate
-                eval_score = self.minimax(depth + 1, False, alpha, beta)
+                eval_score = self.minimax(depth + 1, False, alpha, beta, position)
                 
                 # Undo move
-                self.board[row][col] = 0
+                position.pop()
                 
                 # Update maximum
                 max_eval = max(max_eval, eval_score)
@@ -489,15 +823,15 @@ class TicTacToe:
             # Human's turn - minimize score
             min_eval = float('inf')
             
-            for row, col in self.get_empty_cells():
-                # Try this move
-                self.board[row][col] = 1  # Human is player 1 (X)
+            for row, col in position.empty_cells():
+                # Try this move (Human is player 1, X)
+                position.push(row, col)
                 
                 # Recursively evaluate
-                eval_score = self.minimax(depth + 1, True, alpha, beta)
+                eval_score = self.minimax(depth + 1, True, alpha, beta, position)
                 
                 # Undo move
-                self.board[row][col] = 0
+                position.pop()
                 
                 # Update minimum
                 min_eval = min(min_eval, eval_score)
@@ -511,54 +845,213 @@ class TicTacToe:
     
     def check_winner_for_player(self, player):
         """Check if a specific player has won"""
-        # Check rows
-        for row in range(GRID_SIZE):
-            if self.board[row][0] == self.board[row][1] == self.board[row][2] == player:
-                return True
+        return self.position.is_won(player)
+    
+    def evaluate_moves(self, player=2, position=None):
+        """
+        Score every empty cell with Minimax
         
-        # Check columns
-        for col in range(GRID_SIZE):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] == player:
-                return True
+        The search runs on a private copy of the position, so the live
+        game is never modified and may be drawn or analyzed concurrently.
         
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] == player:
-            return True
+        Parameters:
+        -----------
+        player : int
+            Player to move (1 = X, 2 = O)
+        position : Position, optional
+            Position to evaluate (default: the game position)
         
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] == player:
-            return True
+        Returns:
+        --------
+        dict : {(row, col): score} from that player's point of view
+            10 - d  : the move wins, d moves after it
+            d - 10  : the move loses, d moves after it
+            0       : the move leads to a draw
+        """
+        search = (position or self.position).copy()
+        search.player = player
+        scores = {}
         
-        return False
+        # Try all empty cells
+        for row, col in search.empty_cells():
+            # Try this move
+            search.push(row, col)
+            
+            # Evaluate using minimax (scores are from the AI's view, so
+            # negate them when evaluating for the human player)
+            if player == 2:
+                scores[(row, col)] = self.minimax(0, False, position=search)
+            else:
+                scores[(row, col)] = -self.minimax(0, True, position=search)
+            
+            # Undo move
+            search.pop()
+        
+        return scores
     
     def get_best_move(self):
         """
         Find the best move for AI using Minimax algorithm
         
+        Uses the AI backend in self.policy if one is set. Otherwise uses
+        the shared tablebase when one has been generated, then the
+        hint analysis if it is already available for the current position,
+        and only searches when neither has the answer.
+        
         Returns:
         --------
         tuple : (row, col) of the best move
         """
+        if self.policy is not None:
+            move = self.policy.best_move(self.board)
+            if move is not None:
+                return move
+        
+        if self.tablebase is not None:
+            move = self.tablebase.best_move(self.board)
+            if move is not None:
+                return move
+        
+        key, scores = self.analysis
+        if key != self.position_key() or self.current_player != 2:
+            scores = self.evaluate_moves(2)
+        
         best_score = -float('inf')
         best_move = None
         
-        # Try all empty cells
-        for row, col in self.get_empty_cells():
-            # Try this move
-            self.board[row][col] = 2  # AI is player 2
-            
-            # Evaluate using minimax
-            score = self.minimax(0, False)
-            
-            # Undo move
-            self.board[row][col] = 0
-            
+        for move, score in scores.items():
             # Update best move if this is better
             if score > best_score:
                 best_score = score
-                best_move = (row, col)
+                best_move = move
         
         return best_move
     
+    @staticmethod
+    def describe_score(score, empty_cells):
+        """
+        Convert a score from evaluate_moves() to a readable outcome
+        
+        Returns:
+        --------
+        tuple : ('win' | 'draw' | 'loss', moves until the result)
+            Moves are counted including the evaluated move itself.
+        """
+        if score > 0:
+            return 'win', WIN_SCORE - score + 1
+        if score < 0:
+            return 'loss', WIN_SCORE + score + 1
+        return 'draw', empty_cells
+    
+    # ========================================================================
+    # BACKGROUND MOVE ANALYSIS
+    # ========================================================================
+    
+    def position_key(self):
+        """Hashable key identifying the current position"""
+        return self.position.snapshot()
+    
+    def request_analysis(self):
+        """
+        Start evaluating the current position on a background thread
+        
+        The result is kept in self.analysis until the position changes. Any
+        analysis still running for an older position is discarded when
+        it finishes.
+        """
+        self.analysis_generation += 1
+        threading.Thread(
+            target=self.run_analysis,
+            args=(self.position.snapshot(), self.analysis_generation),
+            daemon=True,
+        ).start()
+    
+    def run_analysis(self, snapshot, generation):
+        """Background thread: evaluate all moves of a position snapshot"""
+        scores = self.evaluate_moves(snapshot.player, Position.from_snapshot(snapshot))
+        if generation == self.analysis_generation:
+            self.analysis = (snapshot, scores)
+    
+    def toggle_hints(self):
+        """Turn the move-analysis overlay on or off"""
+        self.show_hints = not self.show_hints
+        if self.show_hints and not self.game_over:
+            self.request_analysis()
+    
+    # ========================================================================
+    # NETWORKED PLAYER VS PLAYER
+    # ========================================================================
+    
+    def start_network(self, peer):
+        """
+        Start networked PvP over a network.NetworkPeer
+        
+        Our player (X or O) is assigned by the host or relay when the
+        connection is made; until then the board waits for the opponent.
+        """
+        self.peer = peer
+        self.local_player = None
+        self.mode = GameMode.NETWORK
+        self.reset_game()
+    
+    def stop_network(self):
+        """Close the network connection, if any"""
+        if self.peer is not None:
+            self.peer.close()
+            self.peer = None
+        self.local_player = None
+    
+    def process_network(self):
+        """Apply all messages received from the opponent since last frame"""
+        for message in self.peer.poll():
+            if message.type == network.HELLO:
+                self.local_player = message.cell
+                self.reset_game()
+            elif message.type == network.RESET:
+                self.reset_game()
+            elif message.type == network.RESYNC:
+                if self.local_player == 1:
+                    self.peer.send_game(self.position)
+            elif message.type == network.MOVE:
+                self.receive_move(message)
+    
+    def receive_move(self, message):
+        """
+        Apply an opponent's move, checking it against our own position
+        
+        Moves we already have are only checked against our history. A
+        missing, different or illegal move, or a board that doesn't match
+        the opponent's checksum, starts a resync.
+        """
+        history = self.position.history
+        expected = len(history) + 1
+        if 0 < message.seq < expected:
+            # Already played: it must be the same move (and, for our last
+            # move, the same board), or the games have diverged
+            if (history[message.seq - 1] == message.cell
+                    and (message.seq < len(history)
+                         or network.board_checksum(self.position) == message.checksum)):
+                return
+        elif (message.seq == expected and message.cell < 9 and not self.game_over
+                and self.make_move(*divmod(message.cell, 3))
+                and network.board_checksum(self.position) == message.checksum):
+            return
+        
+        # Out of step with the opponent: the host (X) is the authority
+        if self.local_player == 1:
+            self.peer.send_game(self.position)
+        else:
+            self.peer.send(network.RESYNC)
+    
+    def make_local_move(self, row, col):
+        """Make our own move and send it to the opponent"""
+        if self.current_player != self.local_player:
+            return False
+        if not self.make_move(row, col):
+            return False
+        self.peer.send_move(self.position)
+        return True
+    
     # ========================================================================
     # MAIN GAME LOOP
     # ========================================================================
@@ -568,6 +1061,7 @@ class TicTacToe:
         running = True
         pvp_rect = None
         pve_rect = None
+        first_frame = True
         
         while running:
             # Event handling
@@ -575,6 +1069,16 @@ class TicTacToe:
                 if event.type == pygame.QUIT:
                     running = False
                 
+                elif event.type == pygame.VIDEORESIZE:
+                    # Re-layout for the new window size
+                    self.update_layout(event.w, event.h)
+                    if (event.w, event.h) != (self.width, self.height):
+                        # Window was smaller than the minimum size
+                        self.screen = pygame.display.set_mode(
+                            (self.width, self.height), pygame.RESIZABLE)
+                    else:
+                        self.screen = pygame.display.get_surface()
+                
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if self.mode == GameMode.MENU:
                         # Handle menu clicks
@@ -588,7 +1092,13 @@ class TicTacToe:
                     
                     elif not self.game_over and not self.ai_thinking:
                         # Handle game clicks
-                        if self.mode == GameMode.PVP or self.current_player == 1:
+                        if self.mode == GameMode.NETWORK:
+                            mouse_pos = pygame.mouse.get_pos()
+                            row, col = self.get_cell_from_mouse(mouse_pos)
+                            
+                            if row is not None and col is not None:
+                                self.make_local_move(row, col)
+                        elif self.mode == GameMode.PVP or self.current_player == 1:
                             mouse_pos = pygame.mouse.get_pos()
                             row, col = self.get_cell_from_mouse(mouse_pos)
                             
@@ -596,15 +1106,31 @@ class TicTacToe:
                                 self.make_move(row, col)
                 
                 elif event.type == pygame.KEYDOWN:
-                    if self.game_over:
+                    if event.key == pygame.K_h and self.mode != GameMode.MENU:
+                        # Toggle move analysis overlay
+                        self.toggle_hints()
+                    elif event.key == pygame.K_u and self.mode in (GameMode.PVP, GameMode.PVE):
+                        # Undo last move
+                        self.undo_move()
+                    elif event.key == pygame.K_y and self.mode in (GameMode.PVP, GameMode.PVE):
+                        # Redo move
+                        self.redo_move()
+                    elif self.game_over:
                         if event.key == pygame.K_r:
-                            # Restart game
+                            # Restart game (for both players when networked)
                             self.reset_game()
+                            if self.mode == GameMode.NETWORK:
+                                self.peer.send(network.RESET)
                         elif event.key == pygame.K_m:
                             # Back to menu
+                            self.stop_network()
                             self.mode = GameMode.MENU
                             self.reset_game()
             
+            # Opponent's moves (in NETWORK mode)
+            if self.mode == GameMode.NETWORK:
+                self.process_network()
+            
             # AI move (in PVE mode)
             if (self.mode == GameMode.PVE and 
                 self.current_player == 2 and 
@@ -636,11 +1162,15 @@ class TicTacToe:
             
             # Update display
             pygame.display.flip()
+            if first_frame:
+                self.mark_startup("first_frame")
+                first_frame = False
             
             # Control frame rate
             self.clock.tick(60)
         
         # Quit
+        self.stop_network()
         pygame.quit()
         sys.exit()
 